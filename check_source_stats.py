@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Source Stats Check
+Deterministic checks for the adaptive scraping logic, run in CI.
+Simulates several daily runs of scrape_news with stubbed network calls
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+import scraper
+import source_stats
+
+SOURCES = [
+    {"name": "Healthy", "base_url": "https://healthy.example", "category_url": "https://healthy.example/news", "article_selector": "a", "max_articles": 4},
+    {"name": "Mixed", "base_url": "https://mixed.example", "category_url": "https://mixed.example/news", "article_selector": "a", "max_articles": 4},
+    {"name": "Down", "base_url": "https://down.example", "category_url": "https://down.example/news", "article_selector": "a", "max_articles": 3}
+]
+
+# Every source lists a bad /video link first, followed by real stories
+LISTINGS = {
+    source["name"]: [f"{source['base_url']}/video/{i}" for i in range(3)] + [f"{source['base_url']}/news/{i}" for i in range(12)]
+    for source in SOURCES
+}
+
+def fake_article(url):
+    """Healthy always works, Mixed works for 60% of stories, Down always fails; /video is always short."""
+    if url.startswith("https://down.example"):
+        return None
+    if "/video/" in url:
+        return {"title": url, "text": "x" * 50, "url": url}
+    if url.startswith("https://mixed.example") and int(url.rsplit("/", 1)[1]) % 5 >= 3:
+        return {"title": url, "text": "x" * 100, "url": url}
+    return {"title": url, "text": "x" * 1000, "url": url}
+
+def simulate_runs(runs, listings=LISTINGS, fetch=fake_article, tavily_links=()):
+    """Run scrape_news repeatedly with stubbed network calls; return per-run fetch logs and article counts."""
+    fetched = []
+    originals = (scraper.NEWS_SOURCES, scraper.fetch_article_text, scraper.get_article_links, scraper.get_article_links_tavily, scraper.time.sleep)
+
+    def get_links(source, stats=None):
+        links = listings.get(source["name"])
+        if stats is not None:
+            source_stats.record_page(stats, source["name"], links is not None)
+        return list(links or [])
+
+    def fetch_article(url):
+        fetched[-1].append(url)
+        return fetch(url)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["SOURCE_STATS_PATH"] = os.path.join(tmp, "stats.json")
+        scraper.NEWS_SOURCES = SOURCES
+        scraper.fetch_article_text = fetch_article
+        scraper.get_article_links = get_links
+        scraper.get_article_links_tavily = lambda query: list(tavily_links)
+        scraper.time.sleep = lambda seconds: None
+        try:
+            for _ in range(runs):
+                fetched.append([])
+                with contextlib.redirect_stdout(io.StringIO()):
+                    articles = scraper.scrape_news()
+                results.append((fetched[-1], len(articles)))
+            stats = source_stats.load_stats(decay=False)
+        finally:
+            (scraper.NEWS_SOURCES, scraper.fetch_article_text, scraper.get_article_links,
+             scraper.get_article_links_tavily, scraper.time.sleep) = originals
+            del os.environ["SOURCE_STATS_PATH"]
+    return results, stats
+
+def count(urls, prefix):
+    return sum(url.startswith(prefix) for url in urls)
+
+def check_classify():
+    problems = []
+    cases = [
+        (None, "failed"),
+        ({"text": "   "}, "empty"),
+        ({"text": "x" * 300}, "short"),
+        ({"text": "x" * 301}, "usable")
+    ]
+    for article, expected in cases:
+        if source_stats.classify(article) != expected:
+            problems.append(f"classify({article!r:.30}) should be {expected}")
+    return problems
+
+def check_load_stats():
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stats.json")
+        malformed = ["[1, 2]", "null", '{"sources": [1]}', '{"sources": {"x": 5}}', "not json"]
+        for content in malformed:
+            with open(path, "w") as f:
+                f.write(content)
+            if source_stats.load_stats(path) != {"sources": {}, "patterns": {}}:
+                problems.append(f"load_stats should ignore malformed file {content!r}")
+
+        with open(path, "w") as f:
+            json.dump({"sources": {"A": {"fetches": 10, "usable": "bad"}}}, f)
+        decayed = source_stats.load_stats(path)["sources"]["A"]
+        if abs(decayed["fetches"] - 10 * source_stats.DECAY) > 1e-9 or decayed["usable"] != 0.0:
+            problems.append("load_stats should decay counters and zero non-numeric values")
+        if source_stats.load_stats(path, decay=False)["sources"]["A"]["fetches"] != 10:
+            problems.append("load_stats(decay=False) should keep counters unchanged")
+    return problems
+
+def check_fetch_cap():
+    problems = []
+    source = {"name": "A", "max_articles": 4}
+
+    def stats_with(**counters):
+        record = source_stats.empty_record()
+        record.update(counters)
+        return {"sources": {"A": record}, "patterns": {}}
+
+    if source_stats.fetch_cap(stats_with(), source) != 4:
+        problems.append("unknown source should get max_articles fetches")
+    good = source_stats.fetch_cap(stats_with(fetches=10, usable=9), source)
+    mixed = source_stats.fetch_cap(stats_with(fetches=10, usable=5, short=5), source)
+    if not 4 < mixed < good <= 8:
+        problems.append(f"fetch cap should loosen with usable rate (mixed {mixed}, good {good})")
+    if source_stats.fetch_cap(stats_with(fetches=10, failed=8, usable=2), source) != 1:
+        problems.append("mostly failing source should get a single probe fetch")
+    if source_stats.fetch_cap(stats_with(pages=4, page_failed=4), source) != 1:
+        problems.append("source with a failing category page should get a single probe fetch")
+    return problems
+
+def check_simulated_runs():
+    problems = []
+    results, stats = simulate_runs(8)
+    first_fetches, _ = results[0]
+    baseline = len(first_fetches)
+
+    for run, (fetched, total) in enumerate(results[3:], 4):
+        if count(fetched, "https://healthy.example") != 4 or count(fetched, "https://healthy.example/video") > 0:
+            problems.append(f"run {run}: Healthy should deliver 4 articles in 4 fetches, skipping /video")
+        if count(fetched, "https://down.example") > 1:
+            problems.append(f"run {run}: failing source should get at most one probe fetch")
+        if len(fetched) > baseline:
+            problems.append(f"run {run}: {len(fetched)} fetches, more than the first run's {baseline}")
+        if total < 8:
+            problems.append(f"run {run}: only {total} articles from Healthy and Mixed")
+
+    # The cold-start runs sample /video; after that it must be skipped before fetching
+    video = [count(fetched, "https://healthy.example/video") for fetched, _ in results]
+    if sum(video[2:]) > 0:
+        problems.append(f"/video pattern still fetched after cold start (fetches per run: {video})")
+    if stats["sources"]["Down"]["failed"] == 0:
+        problems.append("failed article fetches should be recorded")
+    return problems
+
+def check_single_fetch_pattern():
+    """A bad pattern fetched only once per run must still be judged and skipped under decay."""
+    listings = {
+        "Healthy": ["https://healthy.example/video/0"] + [f"https://healthy.example/news/{i}" for i in range(12)],
+        "Mixed": [],
+        "Down": []
+    }
+    results, _ = simulate_runs(8, listings=listings)
+    video = [count(fetched, "https://healthy.example/video") for fetched, _ in results]
+    if sum(video[4:]) > 1:
+        return [f"single-fetch /video pattern never skipped (fetches per run: {video})"]
+    return []
+
+def check_listing_failures():
+    listings = dict(LISTINGS, Down=None)
+    _, stats = simulate_runs(3, listings=listings)
+    record = stats["sources"].get("Down")
+    if not record or record["page_failed"] == 0:
+        return ["category page failures should be recorded under the source"]
+    return []
+
+def check_duplicate_titles():
+    """Tavily repeating a direct story must not lower any usable rate."""
+    def fetch(url):
+        article = fake_article(url.replace("https://tavily.example/", "https://healthy.example/"))
+        return article and dict(article, url=url)
+
+    listings = {"Healthy": [f"https://healthy.example/news/{i}" for i in range(4)], "Mixed": [], "Down": []}
+    _, stats = simulate_runs(1, listings=listings, fetch=fetch,
+                             tavily_links=[f"https://tavily.example/news/{i}" for i in range(4)])
+    record = stats["sources"].get("Tavily")
+    if not record or record["duplicate"] < 4 or record["fetches"] != 0:
+        return ["duplicate titles should be counted as duplicates, not fetches"]
+    return []
+
+CHECKS = [
+    check_classify,
+    check_load_stats,
+    check_fetch_cap,
+    check_simulated_runs,
+    check_single_fetch_pattern,
+    check_listing_failures,
+    check_duplicate_titles
+]
+
+def main():
+    print("🧪 Source stats checks")
+    print("=" * 50)
+
+    problems = []
+    for check in CHECKS:
+        found = check()
+        print(f"{'✅' if not found else '❌'} {check.__name__}")
+        problems += found
+
+    print("=" * 50)
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        sys.exit(1)
+    print("✅ All source stats checks passed")
+
+if __name__ == "__main__":
+    main()
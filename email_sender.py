@@ -1,11 +1,7 @@
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.image import MIMEImage
 import os
-from dotenv import load_dotenv
-
-load_dotenv()
 
 def get_email_config():
     """Get email configuration from environment variables."""
@@ -49,6 +45,9 @@ def send_email(newsletter_body, subject="সময় ও দেশ - দৈন
             print(f"⚠️ Could not attach logo: {e}")
     
     try:
+        # smtplib pulls in ssl, so only import it when actually sending
+        import smtplib
+        
         # Connect to Gmail SMTP server
         with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
             server.login(email, app_password)
@@ -62,6 +61,9 @@ def send_email(newsletter_body, subject="সময় ও দেশ - দৈন
         return False
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+    
     # Test email sending
     print("Testing email config for recipients...")
     _, _, recs = get_email_config()
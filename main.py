@@ -5,7 +5,6 @@ Scrapes Bangla news, summarizes, and sends via email
 """
 
 import os
-from dotenv import load_dotenv
 from scraper import scrape_news
 from summarizer import summarize_articles
 from newsletter import build_html_newsletter
@@ -15,6 +14,7 @@ def main():
     """Main pipeline execution."""
     
     # Load environment variables (for local testing)
+    from dotenv import load_dotenv
     load_dotenv()
     
     print("🚀 Starting Bangla News Pipeline...")
@@ -1,7 +1,8 @@
-import requests
-from bs4 import BeautifulSoup
-from readability import Document
 import time
+from source_stats import (
+    MAX_LINKS, load_stats, save_stats, format_report, classify, record_page,
+    record_fetch, record_link, fetch_cap, rank_links, should_skip
+)
 
 # Test mode with sample data
 TEST_MODE = False  # Set to False to use real scraping/Tavily
@@ -66,6 +67,11 @@ def get_article_links_tavily(query="Top news in Bangladesh last 24 hours in Bang
 
 def fetch_article_text(url):
     """Fetch and extract clean article text from URL."""
+    # HTTP and parsing libraries are imported lazily to keep startup fast
+    import requests
+    from bs4 import BeautifulSoup
+    from readability import Document
+    
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -90,8 +96,12 @@ def fetch_article_text(url):
         print(f"Error fetching {url}: {e}")
         return None
 
-def get_article_links(source):
-    """Get article links from a news source."""
+def get_article_links(source, stats=None):
+    """Get up to MAX_LINKS article links from a news source, recording the page request in stats."""
+    import requests
+    from bs4 import BeautifulSoup
+    
+    started = time.time()
     try:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -102,7 +112,7 @@ def get_article_links(source):
         soup = BeautifulSoup(response.text, "lxml")
         links = []
         
-        for link in soup.select(source["article_selector"])[:15]:
+        for link in soup.select(source["article_selector"])[:MAX_LINKS]:
             href = link.get("href")
             if href:
                 if not href.startswith("http"):
@@ -111,11 +121,44 @@ def get_article_links(source):
                 if source["base_url"] in href or "bbc.com/bangla/articles" in href:
                     links.append(href)
         
-        return list(dict.fromkeys(links))[:source["max_articles"]]
+        if stats is not None:
+            record_page(stats, source["name"], True, latency=time.time() - started)
+        return list(dict.fromkeys(links))
     except Exception as e:
         print(f"Error getting links from {source['name']}: {e}")
+        if stats is not None:
+            record_page(stats, source["name"], False, latency=time.time() - started)
         return []
 
+def fetch_and_record(link, source_name, stats, seen_urls, seen_titles):
+    """Fetch a link once and record its outcome. Returns (fetched, article or None)."""
+    if link in seen_urls:
+        record_link(stats, source_name, link, "duplicate")
+        return False, None
+    seen_urls.add(link)
+    
+    # Stats update as we go, so a pattern being re-probed stops after a few bad pages
+    if should_skip(stats, link):
+        record_link(stats, source_name, link, "skipped")
+        return False, None
+    
+    print(f"Fetching from {source_name}: {link}")
+    started = time.time()
+    article = fetch_article_text(link)
+    outcome = classify(article)
+    if outcome == "usable" and article["title"] in seen_titles:
+        # Same story under another URL; not the source's fault, so keep it out of the usable rate
+        record_link(stats, source_name, link, "duplicate")
+        outcome = "duplicate"
+    else:
+        record_fetch(stats, source_name, link, outcome, latency=time.time() - started)
+    time.sleep(1)
+    
+    if outcome != "usable":
+        return True, None
+    seen_titles.add(article["title"])
+    return True, article
+
 def scrape_news():
     """Scrape articles from all news sources and Tavily to ensure at least 8-10 articles."""
     
@@ -125,19 +168,24 @@ def scrape_news():
     
     articles = []
     seen_urls = set()
+    seen_titles = set()
+    stats = load_stats()
     
     # 1. Direct scraping from major sources
     for source in NEWS_SOURCES:
         print(f"Scraping {source['name']}...")
-        links = get_article_links(source)
+        links = rank_links(stats, get_article_links(source, stats))
+        cap = fetch_cap(stats, source)
+        found = fetched = 0
         
         for link in links:
-            if link not in seen_urls:
-                article = fetch_article_text(link)
-                if article and len(article["text"]) > 300:
-                    articles.append(article)
-                    seen_urls.add(link)
-                time.sleep(1) 
+            # Aim for max_articles usable articles, within the source's fetch cap
+            if found >= source["max_articles"] or fetched >= cap: break
+            was_fetched, article = fetch_and_record(link, source["name"], stats, seen_urls, seen_titles)
+            fetched += was_fetched
+            if article:
+                articles.append(article)
+                found += 1
     
     # 2. Tavily expansion/fallback to hit target
     if len(articles) < 10:
@@ -148,14 +196,12 @@ def scrape_news():
             tavily_links = get_article_links_tavily(query=query)
             for link in tavily_links:
                 if len(articles) >= 12: break
-                if link not in seen_urls:
-                    print(f"Fetching from Tavily: {link}")
-                    article = fetch_article_text(link)
-                    if article and len(article["text"]) > 300:
-                        articles.append(article)
-                        seen_urls.add(link)
-                    time.sleep(1)
+                _, article = fetch_and_record(link, "Tavily", stats, seen_urls, seen_titles)
+                if article:
+                    articles.append(article)
     
+    save_stats(stats)
+    print(format_report(stats))
     print(f"Scraped {len(articles)} articles total (Direct + Tavily)")
     return articles[:12]
 
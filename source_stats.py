@@ -0,0 +1,193 @@
+import os
+import json
+import math
+from urllib.parse import urlparse
+
+# Where yield statistics are kept between runs (cached by the GitHub workflow)
+def get_stats_path():
+    default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "source_stats.json")
+    return os.getenv("SOURCE_STATS_PATH", default)
+
+# Articles shorter than this are discarded as unusable
+MIN_ARTICLE_CHARS = 300
+
+# Older runs count less each time the stats are loaded, so sources can recover.
+# One fetch per run settles at DECAY / (1 - DECAY) = 9 samples, well above MIN_SAMPLES
+DECAY = 0.9
+
+# Samples needed before a source or URL pattern is judged
+MIN_SAMPLES = 3
+
+# Sources failing (errors, blocks, timeouts) at least this often get a single probe fetch
+BACKOFF_FAILURE_RATE = 0.5
+
+# Patterns without enough samples rank as if this share of their pages were usable
+UNKNOWN_YIELD = 0.5
+
+# URL patterns below this usable rate are skipped before fetching
+SKIP_YIELD = 0.2
+
+# Upper bound on candidate links taken from one category page
+MAX_LINKS = 15
+
+GROUPS = ["sources", "patterns"]
+
+COUNTERS = [
+    "pages", "page_failed", "page_latency",
+    "links", "skipped", "fetches", "usable", "short", "empty", "failed", "duplicate", "latency"
+]
+
+def empty_record():
+    return {counter: 0.0 for counter in COUNTERS}
+
+def _number(value):
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+def load_stats(path=None, decay=True):
+    """Load stats from disk, optionally decaying previous runs."""
+    path = path or get_stats_path()
+    stats = {group: {} for group in GROUPS}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return stats
+
+    # A malformed file must never abort the daily run; keep only well-formed records
+    if not isinstance(data, dict):
+        return stats
+    factor = DECAY if decay else 1.0
+    for group in GROUPS:
+        records = data.get(group)
+        if not isinstance(records, dict):
+            continue
+        for key, record in records.items():
+            if not isinstance(record, dict):
+                continue
+            stats[group][key] = {
+                counter: _number(record.get(counter)) * factor for counter in COUNTERS
+            }
+    return stats
+
+def save_stats(stats, path=None):
+    """Write stats to disk."""
+    path = path or get_stats_path()
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(stats, f, ensure_ascii=False, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"⚠️ Could not save source stats: {e}")
+
+def url_pattern(url):
+    """Group a URL by host and first path segment, e.g. 'www.prothomalo.com/video'."""
+    parsed = urlparse(url)
+    segments = [s for s in parsed.path.split("/") if s]
+    return parsed.netloc + ("/" + segments[0] if segments else "")
+
+def classify(article, min_chars=MIN_ARTICLE_CHARS):
+    """Classify a fetch result as usable, short, empty or failed."""
+    if article is None:
+        return "failed"
+    if not article["text"].strip():
+        return "empty"
+    if len(article["text"]) <= min_chars:
+        return "short"
+    return "usable"
+
+def _records(stats, source_name, url):
+    for group, key in [("sources", source_name), ("patterns", url_pattern(url))]:
+        yield stats[group].setdefault(key, empty_record())
+
+def record_page(stats, source_name, ok, latency=0.0):
+    """Record a category page request for a source."""
+    record = stats["sources"].setdefault(source_name, empty_record())
+    record["pages"] += 1
+    record["page_failed"] += 0 if ok else 1
+    record["page_latency"] += latency
+
+def record_link(stats, source_name, url, outcome):
+    """Record a link that produced no new article without counting against the usable rate.
+
+    Outcome is 'skipped', or 'duplicate' for a URL or title already collected this run.
+    """
+    for record in _records(stats, source_name, url):
+        record["links"] += 1
+        record[outcome] += 1
+
+def record_fetch(stats, source_name, url, outcome, latency=0.0):
+    """Record the outcome of one article fetch for its source and URL pattern."""
+    for record in _records(stats, source_name, url):
+        record["links"] += 1
+        record["fetches"] += 1
+        record[outcome] += 1
+        record["latency"] += latency
+
+def usable_rate(record):
+    """Share of fetches that produced a usable article, or None if too few samples."""
+    if not record or record["fetches"] < MIN_SAMPLES:
+        return None
+    return record["usable"] / record["fetches"]
+
+def failure_rate(record):
+    """Share of page and article requests that failed, or None if too few samples."""
+    if not record:
+        return None
+    requests = record["pages"] + record["fetches"]
+    if requests < MIN_SAMPLES:
+        return None
+    return (record["page_failed"] + record["failed"]) / requests
+
+def fetch_cap(stats, source):
+    """Most article fetches a source gets while trying to collect its max_articles.
+
+    The cap loosens with the source's usable rate, up to twice max_articles, and
+    drops to a single probe fetch when most requests to the source fail.
+    """
+    record = stats["sources"].get(source["name"])
+    failures = failure_rate(record)
+    if failures is not None and failures >= BACKOFF_FAILURE_RATE:
+        return 1
+    rate = usable_rate(record)
+    if rate is None:
+        return source["max_articles"]
+    return source["max_articles"] + math.ceil(source["max_articles"] * rate)
+
+def pattern_rate(stats, url):
+    """Usable rate of a URL's pattern, or None if too few samples."""
+    return usable_rate(stats["patterns"].get(url_pattern(url)))
+
+def rank_links(stats, links):
+    """Order links so patterns with the best past yield are fetched first."""
+    def score(url):
+        rate = pattern_rate(stats, url)
+        return UNKNOWN_YIELD if rate is None else rate
+    return sorted(links, key=score, reverse=True)
+
+def should_skip(stats, url):
+    """Skip URLs whose pattern has consistently failed to produce usable articles."""
+    rate = pattern_rate(stats, url)
+    return rate is not None and rate < SKIP_YIELD
+
+def format_report(stats, group="sources"):
+    """Format a yield table for one stats group."""
+    lines = [f"{'name':<40} {'pg fail':>7} {'links':>6} {'fetches':>7} {'usable':>7} {'short':>7} {'failed':>7} {'dup':>5} {'skip':>5} {'avg s':>6}"]
+    for name, record in sorted(stats[group].items()):
+        links = record["links"] or 1
+        fetches = record["fetches"] or 1
+        pages = record["pages"] or 1
+        lines.append(
+            f"{name[:40]:<40} {record['page_failed'] / pages:7.0%} {record['links']:6.1f} {record['fetches']:7.1f} "
+            f"{record['usable'] / fetches:7.0%} "
+            f"{(record['short'] + record['empty']) / fetches:7.0%} "
+            f"{record['failed'] / fetches:7.0%} "
+            f"{record['duplicate'] / links:5.0%} "
+            f"{record['skipped'] / links:5.0%} "
+            f"{record['latency'] / fetches:6.1f}"
+        )
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    stats = load_stats(decay=False)
+    for group in GROUPS:
+        print(f"\n📊 {group.capitalize()}")
+        print(format_report(stats, group))
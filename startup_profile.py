@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Startup Profile
+Reports per-module import time for the pipeline entry points and
+checks it against a startup budget (used as a regression check in CI)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ENTRY_POINTS = ["main", "scraper", "summarizer", "newsletter", "email_sender"]
+
+# Heavy SDKs and parsers that must only load when their code path runs
+LAZY_MODULES = ["google.genai", "groq", "tavily", "requests", "bs4", "readability", "lxml", "dotenv"]
+
+DEFAULT_BUDGET_MS = 200
+
+def profile_imports(module):
+    """Import a module in a fresh interpreter and return per-module import times in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()}")
+
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.replace("import time:", "", 1).split("|")
+        timings.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000
+        })
+    return timings
+
+def check_startup(module, budget_ms=DEFAULT_BUDGET_MS, top=10):
+    """Print a startup report for a module and return a list of budget violations."""
+    timings = profile_imports(module)
+    total = next((t["cumulative_ms"] for t in timings if t["module"] == module), 0.0)
+    loaded = {t["module"] for t in timings}
+
+    print(f"\n📦 {module}: {total:.1f} ms (budget {budget_ms} ms)")
+    for t in sorted(timings, key=lambda t: t["cumulative_ms"], reverse=True)[:top]:
+        print(f"   {t['cumulative_ms']:8.1f} ms  {t['self_ms']:8.1f} ms  {t['module']}")
+
+    problems = []
+    if total > budget_ms:
+        problems.append(f"{module} took {total:.1f} ms to import (budget {budget_ms} ms)")
+    for lazy in LAZY_MODULES:
+        # Match submodules too, so importing e.g. bs4.element first is still caught
+        if any(name == lazy or name.startswith(lazy + ".") for name in loaded):
+            problems.append(f"{module} eagerly imports {lazy}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile import time of the pipeline entry points.")
+    parser.add_argument("modules", nargs="*", default=ENTRY_POINTS, help="Modules to profile")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Maximum import time per module")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    args = parser.parse_args()
+
+    print("⏱️  Startup profile (cumulative / self)")
+    print("=" * 50)
+
+    problems = []
+    for module in args.modules:
+        problems += check_startup(module, budget_ms=args.budget_ms, top=args.top)
+
+    print("=" * 50)
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        sys.exit(1)
+    print("✅ All entry points within startup budget")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,5 @@
 import os
 import time
-from google import genai
-from google.genai import types
-from groq import Groq
-from dotenv import load_dotenv
-
-load_dotenv()
 
 def get_gemini_api_key():
     """Get Gemini API key from environment."""
@@ -21,7 +15,9 @@ def summarize_with_gemini(title, text, retries=1):
         try:
             api_key = get_gemini_api_key()
             if not api_key: return None
-                
+            
+            # Imported lazily so runs that never reach the LLM skip the SDK
+            from google import genai
             client = genai.Client(api_key=api_key)
             prompt = f"""
             আপনি 'সময় ও দেশ' (somoyodesh.com) নিউজ এজেন্সির একজন পেশাদার সংবাদ প্রতিনিধি (Reporter)। 
@@ -67,7 +63,8 @@ def summarize_with_groq(title, text, retries=1):
         try:
             api_key = get_groq_api_key()
             if not api_key: return None
-                
+            
+            from groq import Groq
             client = Groq(api_key=api_key)
             prompt = f"""
             আপনি 'সময় ও দেশ' (somoyodesh.com) নিউজ এজেন্সির একজন পেশাদার সংবাদ প্রতিনিধি (Reporter)। 
@@ -174,6 +171,8 @@ def summarize_articles(articles):
     return summarized
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
     sample = "রাজধানী ঢাকায় মেট্রো রেলের নতুন লাইন উদ্বোধন করা হয়েছে।"
     title, report = process_article("Metro Update", sample)
     print(f"\nTitle: {title}\nReport: {report}")